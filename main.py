@@ -9,19 +9,61 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from src.recipe_helper import parse_ingredients, match_recipes, explain_recipe, suggest_substitute, get_available_diets,_get_valid_ingredients
+from src.recipe_helper import parse_ingredients, match_recipes, explain_recipe, suggest_substitute, get_available_diets,_get_valid_ingredients, find_recipe_by_title_or_index
 from src.openai_helper import ask_openai, generate_recipes_from_ingredients
+import builtins
 import os
 import sys
 import json
 import re
-from datetime import datetime
-from rich import print 
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Rich is only worth its import and markup-parsing cost on an interactive terminal;
+# when output is piped or redirected, strip the markup tags and use the builtin print.
+if sys.stdout.isatty():
+    from rich import print
+else:
+    _MARKUP_RE = re.compile(r"\[/?[a-z#@][^\[\]]*\]")
+
+    def print(*args, **kwargs):
+        builtins.print(*(_MARKUP_RE.sub("", a) if isinstance(a, str) else a for a in args), **kwargs)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import instead of per call
+_DIGIT_RE = re.compile(r"\d+")
+
+# Filename-safe characters; every other ASCII character maps to "_"
+_ALLOWED = frozenset(string.ascii_letters + string.digits + "_-")
+_SAFE_FN_TRANS = str.maketrans({chr(i): "_" for i in range(128) if chr(i) not in _ALLOWED})
 
 
 def _safe_filename(title: str) -> str:
     # make a simple safe filename from title
-    return re.sub(r"[^0-9a-zA-Z_-]", "_", title).strip("_")
+    if title.isascii():
+        return title.translate(_SAFE_FN_TRANS).strip("_")
+    return "".join(c if c in _ALLOWED else "_" for c in title).strip("_")
+
+
+# Background writer for recipe cards so a slow disk doesn't stall the prompt.
+# A single worker keeps writes in submission order; concurrent.futures joins
+# its workers at interpreter exit, so pending writes still finish.
+_IO_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def _write_card(path: str, content: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    except OSError as e:
+        # Runs in the background, so report instead of losing the error silently
+        builtins.print(f"Could not write recipe card {path}: {e}", file=sys.stderr)
 
 
 def ask_user(prompt: str) -> str:
@@ -47,6 +89,107 @@ def _get_arg_value(args, flag: str, default: int) -> int:
     return default
 
 
+def _handle_make(ql: str, selected: dict, have: frozenset) -> None:
+    """Confirmation flow: shopping list, optional save + recipe card, timers."""
+    # Show shopping list vs available ingredients
+    recipe_ings = selected.get("ingredients", [])
+    print("\nGreat — preparing this recipe for you.")
+    print("Shopping list:")
+    for ing in recipe_ings:
+        mark = "(have)" if ing.lower() in have else "(missing)"
+        print(f" - {ing} {mark}")
+
+    # Estimate cost (very rough heuristic)
+    est_cost = round(len(recipe_ings) * 1.75, 2)
+    print(f"Estimated cost (rough): ${est_cost}")
+
+    # Offer to save recipe and write a printable recipe card
+    save = ask_user("Save this recipe to your saved list and create a recipe card? (y/n)")
+    if save.lower() in ("y", "yes"):
+        saved_path = os.path.join("saved_recipes.json")
+        try:
+            with open(saved_path, "rb") as f:
+                data = f.read()
+            saved = orjson.loads(data) if orjson else json.loads(data)
+        except FileNotFoundError:
+            saved = []
+        except (OSError, ValueError):
+            # Unreadable or corrupt file (JSONDecodeError is a ValueError): start fresh
+            saved = []
+        entry = {"title": selected.get("title"), "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "allergens": selected.get("allergens", [])}
+        saved.append(entry)
+        # Encode once and write in a single call instead of json.dump's per-token writes
+        if orjson:
+            with open(saved_path, "wb") as f:
+                f.write(orjson.dumps(saved, option=orjson.OPT_INDENT_2))
+        else:
+            with open(saved_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(saved, indent=2))
+        # create a simple recipe card file
+        card_dir = os.path.join("saved_cards")
+        fname = _safe_filename(selected.get("title", "recipe")) + ".txt"
+        card_path = os.path.join(card_dir, fname)
+        # Build the whole card and write it in one call, off the interactive thread
+        parts = [f"{selected.get('title')}\n", "Ingredients:\n"]
+        parts += [f" - {ing}\n" for ing in recipe_ings]
+        parts.append("\nAllergens:\n")
+        if selected.get("allergens"):
+            parts += [f" - {a}\n" for a in selected.get("allergens")]
+        else:
+            parts.append(" - (none detected)\n")
+        parts.append("\nSteps:\n")
+        parts += [f" - {step}\n" for step in selected.get("steps", [])]
+        parts.append(f"\nTime: {selected.get('time')}\n")
+        parts.append("\nNutrition (rough estimate):\n")
+        nutrition = selected.get("nutrition", {})
+        if nutrition:
+            parts += [
+                f" - Calories: {nutrition.get('calories')}\n",
+                f" - Protein: {nutrition.get('protein_g')}g\n",
+                f" - Carbs: {nutrition.get('carbs_g')}g\n",
+                f" - Fat: {nutrition.get('fat_g')}g\n",
+            ]
+        parts.append("\n(Nutrition estimates are best-effort and should NOT be used for medical/diet purposes.)\n")
+        _IO_POOL.submit(_write_card, card_path, "".join(parts))
+        print(f"Saved to {saved_path}; recipe card is being written to {card_path}")
+
+    # Timers suggestion based on recipe time
+    t = selected.get("time", "")
+    m = _DIGIT_RE.search(t)
+    if m:
+        total = int(m.group())
+        prep = max(5, total // 4)
+        cook = max(5, total - prep)
+        print(f"Suggested timers: prep ~{prep} minutes, cook ~{cook} minutes (total {total} minutes)")
+    else:
+        print("Suggested timers: prep ~10 minutes, cook ~15 minutes")
+
+
+def _handle_substitute(ql: str, selected: dict, have: frozenset) -> None:
+    part = ql.split("have", 1)[-1].strip()
+    sub = suggest_substitute(part)
+    print(sub)
+
+
+def _handle_time(ql: str, selected: dict, have: frozenset) -> None:
+    print(f"This recipe takes about {selected.get('time')}")
+
+
+def _handle_steps(ql: str, selected: dict, have: frozenset) -> None:
+    print(explain_recipe(selected))
+
+
+# Follow-up question routes, checked in order against the lowercased question.
+# For now we use the simple built-in responders for basic questions and fall
+# back to the AI helper for anything else.
+ROUTES = (
+    (("want to make this",), _handle_make),
+    (("i don't have", "dont have"), _handle_substitute),
+    (("time", "how long"), _handle_time),
+    (("steps", "how do i"), _handle_steps),
+)
+
+
 def main():
     # support quick check: `python main.py --show-key`
     if "--show-key" in sys.argv:
@@ -93,6 +236,9 @@ def main():
         else:
             print(f"[green]Great! You've entered {len(ingredients)} ingredients.[/green]")
 
+    # parse_ingredients already normalizes, so this is ready for O(1) lookups
+    have = frozenset(ingredients)
+
     # Local recipe matches first
     matches = match_recipes(ingredients, min_match=2, diet=diet_filter)
     options = [(r, count, "local") for r, count in matches[:max_results]]
@@ -127,10 +273,12 @@ def main():
         sys.exit(0)
 
     print(f"[cyan]Great! Here are up to {len(options)} recipe options:[/cyan]")
+    lines = []
     for i, (r, count, source) in enumerate(options, 1):
         diets_str = f" — {', '.join(r.get('diets', []))}" if r.get('diets') else ""
         match_note = f" — matches {count} ingredient(s)" if count is not None else ""
-        print(f"{i}. {r.get('title')} ({r.get('time', 'time n/a')}){diets_str}{match_note}")
+        lines.append(f"{i}. {r.get('title')} ({r.get('time', 'time n/a')}){diets_str}{match_note}")
+    print("\n".join(lines))
 
     choice = ask_user("Which number would you like to know more about, or type a recipe name? (or 'no' to exit)")
     if choice.lower() in ('no', 'n', 'exit', 'quit'):
@@ -143,7 +291,6 @@ def main():
         if 0 <= idx < len(options):
             selected = options[idx][0]
     if not selected:
-        from src.recipe_helper import find_recipe_by_title_or_index
         r = find_recipe_by_title_or_index(choice)
         if r:
             selected = r
@@ -184,95 +331,17 @@ def main():
         if not q:
             continue
 
-        if q.lower() in ("exit", "quit", "no"):
+        ql = q.lower()
+        if ql in ("exit", "quit", "no"):
             print("Bye — happy cooking!")
             break
-        # New: handle confirmation flow
-        if "want to make this" in q.lower() or q.lower().strip() == "want to make this":
-            # Show shopping list vs available ingredients
-            have = [i.lower() for i in ingredients]
-            recipe_ings = selected.get("ingredients", [])
-            missing = [ing for ing in recipe_ings if ing.lower() not in have]
-            print("\nGreat — preparing this recipe for you.")
-            print("Shopping list:")
-            for ing in recipe_ings:
-                mark = "(have)" if ing.lower() in have else "(missing)"
-                print(f" - {ing} {mark}")
-
-            # Estimate cost (very rough heuristic)
-            est_cost = round(len(recipe_ings) * 1.75, 2)
-            print(f"Estimated cost (rough): ${est_cost}")
-
-            # Offer to save recipe and write a printable recipe card
-            save = ask_user("Save this recipe to your saved list and create a recipe card? (y/n)")
-            if save.lower() in ("y", "yes"):
-                saved_path = os.path.join("saved_recipes.json")
-                try:
-                    if os.path.exists(saved_path):
-                        with open(saved_path, "r", encoding="utf-8") as f:
-                            saved = json.load(f)
-                    else:
-                        saved = []
-                except Exception:
-                    saved = []
-                entry = {"title": selected.get("title"), "saved_at": datetime.utcnow().isoformat(), "allergens": selected.get("allergens", [])}
-                saved.append(entry)
-                with open(saved_path, "w", encoding="utf-8") as f:
-                    json.dump(saved, f, indent=2)
-                # create a simple recipe card file
-                card_dir = os.path.join("saved_cards")
-                os.makedirs(card_dir, exist_ok=True)
-                fname = _safe_filename(selected.get("title", "recipe")) + ".txt"
-                card_path = os.path.join(card_dir, fname)
-                with open(card_path, "w", encoding="utf-8") as f:
-                    f.write(f"{selected.get('title')}\n")
-                    f.write("Ingredients:\n")
-                    for ing in recipe_ings:
-                        f.write(f" - {ing}\n")
-                    f.write("\nAllergens:\n")
-                    if selected.get("allergens"):
-                        for a in selected.get("allergens"):
-                            f.write(f" - {a}\n")
-                    else:
-                        f.write(" - (none detected)\n")
-                    f.write("\nSteps:\n")
-                    for step in selected.get("steps", []):
-                        f.write(f" - {step}\n")
-                    f.write(f"\nTime: {selected.get('time')}\n")
-                    f.write("\nNutrition (rough estimate):\n")
-                    nutrition = selected.get("nutrition", {})
-                    if nutrition:
-                        f.write(f" - Calories: {nutrition.get('calories')}\n")
-                        f.write(f" - Protein: {nutrition.get('protein_g')}g\n")
-                        f.write(f" - Carbs: {nutrition.get('carbs_g')}g\n")
-                        f.write(f" - Fat: {nutrition.get('fat_g')}g\n")
-                    f.write("\n(Nutrition estimates are best-effort and should NOT be used for medical/diet purposes.)\n")
-                print(f"Saved to {saved_path} and created recipe card at {card_path}")
-
-            # Timers suggestion based on recipe time
-            t = selected.get("time", "")
-            m = re.search(r"(\d+)", t)
-            if m:
-                total = int(m.group(1))
-                prep = max(5, total // 4)
-                cook = max(5, total - prep)
-                print(f"Suggested timers: prep ~{prep} minutes, cook ~{cook} minutes (total {total} minutes)")
-            else:
-                print("Suggested timers: prep ~10 minutes, cook ~15 minutes")
-            continue
-        if "i don't have" in q.lower() or "dont have" in q.lower():
-            part = q.lower().split("have", 1)[-1].strip()
-            sub = suggest_substitute(part)
-            print(sub)
-            continue
-        # For now we use the simple built-in responder in recipe_helper for basic questions
-        # (openai integration can be added later)
-        if "time" in q.lower() or "how long" in q.lower():
-            print(f"This recipe takes about {selected.get('time')}")
-            continue
-        if "steps" in q.lower() or "how do i" in q.lower():
-            print(explain_recipe(selected))
+
+        # Dispatch to the first built-in responder whose keywords appear in the question
+        handler = next((fn for kws, fn in ROUTES if any(k in ql for k in kws)), None)
+        if handler:
+            handler(ql, selected, have)
             continue
+
         # Try OpenAI for richer free-form follow-ups when configured
         openai_answer = None
         try:
@@ -19,6 +19,35 @@ except Exception:
     RateLimitError = None
     APIError = None
 
+# orjson decodes the number-heavy recipe payloads several times faster when available
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Shared Groq client, created on first use so its connection pool is reused
+_CLIENT = None
+
+# LRU cache of answers fetched this session, keyed by (question, recipe summary, prompt, model)
+_ANSWER_CACHE: Dict[tuple, str] = {}
+_ANSWER_CACHE_MAX = 256
+
+
+def _get_client():
+    """Return the shared Groq client, or None when the API key/library is missing."""
+    global _CLIENT
+    if _CLIENT is None:
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key or Groq is None:
+            return None
+        try:
+            _CLIENT = Groq(api_key=api_key)
+        except Exception:
+            return None
+    return _CLIENT
+
 
 def _retry_with_backoff(func, max_retries=3, initial_delay=1.0):
     """Retry a function with exponential backoff for rate limit errors.
@@ -71,14 +100,8 @@ def ask_openai(question: str, recipe: Dict[str, Any], system_prompt: Optional[st
     Returns:
         Answer text when successful, or None when API key/library is missing or on error.
     """
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key or Groq is None:
-        return None
-
-    # Initialize Groq client with API key
-    try:
-        client = Groq(api_key=api_key)
-    except Exception:
+    client = _get_client()
+    if client is None:
         return None
 
     # Build context for the model
@@ -88,6 +111,14 @@ def ask_openai(question: str, recipe: Dict[str, Any], system_prompt: Optional[st
 
     # Add recipe summary as context
     recipe_summary = f"Title: {recipe.get('title')}\nTime: {recipe.get('time')}\nIngredients: {', '.join(recipe.get('ingredients', []))}\nSteps: {' | '.join(recipe.get('steps', []))}"
+
+    # Repeat questions in the same session skip the network round-trip
+    cache_key = (question, recipe_summary, sys_p, model)
+    if cache_key in _ANSWER_CACHE:
+        # Re-insert on a hit so the dict stays in least-recently-used order
+        answer = _ANSWER_CACHE.pop(cache_key)
+        _ANSWER_CACHE[cache_key] = answer
+        return answer
     
     def _make_request():
         response = client.chat.completions.create(
@@ -106,7 +137,13 @@ def ask_openai(question: str, recipe: Dict[str, Any], system_prompt: Optional[st
             return text.strip() if text else None
         return None
     
-    return _retry_with_backoff(_make_request, max_retries=3, initial_delay=1.0)
+    answer = _retry_with_backoff(_make_request, max_retries=3, initial_delay=1.0)
+    # Only cache real answers so transient failures (rate limits) are retried next time
+    if answer:
+        if len(_ANSWER_CACHE) >= _ANSWER_CACHE_MAX:
+            _ANSWER_CACHE.pop(next(iter(_ANSWER_CACHE)))  # evict least recently used
+        _ANSWER_CACHE[cache_key] = answer
+    return answer
 
 
 def generate_recipes_from_ingredients(
@@ -127,13 +164,8 @@ def generate_recipes_from_ingredients(
         List of recipe dicts with title, ingredients, steps, time, diets, allergens, nutrition
         or None if API key missing/error occurs.
     """
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key or Groq is None:
-        return None
-    
-    try:
-        client = Groq(api_key=api_key)
-    except Exception:
+    client = _get_client()
+    if client is None:
         return None
         
     # Build the prompt for recipe generation
@@ -185,16 +217,23 @@ Ensure:
             max_tokens=4000,
             temperature=0.7,
             timeout=10,
+            stream=True,
         )
         
-        if not response.choices or len(response.choices) == 0:
-            return None
+        # Collect streamed tokens as they arrive and join once at the end
+        parts = []
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
         
-        response_text = response.choices[0].message.content.strip()
+        response_text = "".join(parts).strip()
+        if not response_text:
+            return None
         
         # Try to parse JSON from the response
+        # (orjson.JSONDecodeError subclasses json.JSONDecodeError)
         try:
-            recipes = json.loads(response_text)
+            recipes = _loads(response_text)
             if isinstance(recipes, list) and len(recipes) > 0:
                 return recipes
         except json.JSONDecodeError:
@@ -203,7 +242,7 @@ Ensure:
             match = re.search(r'\[.*\]', response_text, re.DOTALL)
             if match:
                 try:
-                    recipes = json.loads(match.group())
+                    recipes = _loads(match.group())
                     if isinstance(recipes, list) and len(recipes) > 0:
                         return recipes
                 except json.JSONDecodeError:
@@ -11,18 +11,55 @@ This module provides:
 - Ingredient substitution suggestions
 - Recipe lookup by index or title
 
-The recipe database is loaded from recipes.json on module import.
+The recipe database is loaded from recipes.json on module import. A pickled
+copy is cached next to it (recipes.json.pkl) so later launches skip the JSON
+parse; like a .pyc, the cache records the source's mtime and size and is
+rebuilt unless both still match exactly.
 """
 import json
 import os
+import pickle
+from collections import defaultdict
 from typing import List, Dict, Any, Tuple
 
 # Load recipe database from JSON file in project root
 BASE = os.path.dirname(os.path.dirname(__file__))
 RECIPES_PATH = os.path.join(BASE, "recipes.json")
-
-with open(RECIPES_PATH, "r", encoding="utf-8") as f:
-    RECIPES = json.load(f)
+RECIPES_CACHE_PATH = RECIPES_PATH + ".pkl"
+
+
+def _load_recipes() -> List[Dict[str, Any]]:
+    """Load the recipe database, preferring the pickle cache when it is fresh."""
+    st = os.stat(RECIPES_PATH)
+    source_key = (st.st_mtime_ns, st.st_size)
+    try:
+        with open(RECIPES_CACHE_PATH, "rb") as f:
+            cached = pickle.loads(f.read())
+        if cached["source"] == source_key:
+            return cached["recipes"]
+    except Exception:
+        pass  # Missing, stale-format or corrupt cache: fall back to the JSON source
+
+    with open(RECIPES_PATH, "rb") as f:
+        recipes = json.loads(f.read())
+
+    # Best-effort atomic cache write (tmp file + os.replace) so a concurrent
+    # launch never sees a half-written pickle; a read-only checkout just
+    # parses JSON every time
+    tmp_path = f"{RECIPES_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(pickle.dumps({"source": source_key, "recipes": recipes}, protocol=5))
+        os.replace(tmp_path, RECIPES_CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return recipes
+
+
+RECIPES = _load_recipes()
 
 
 def normalize(text: str) -> str:
@@ -37,6 +74,38 @@ def normalize(text: str) -> str:
     return text.lower().strip()
 
 
+# Precompute normalized lookup fields once so queries don't redo string work.
+# Underscore-prefixed keys are internal and never shown to the user.
+for _r in RECIPES:
+    _r["_ing_set"] = frozenset(normalize(i) for i in _r.get("ingredients", []))
+    _r["_diet_set"] = frozenset(normalize(d) for d in _r.get("diets", []))
+    _r["_title_lower"] = normalize(_r.get("title", ""))
+
+AVAILABLE_DIETS = tuple(sorted({d for _r in RECIPES for d in _r.get("diets", [])}))
+
+# Inverted indexes: normalized ingredient / diet -> positions in RECIPES
+INDEX: Dict[str, List[int]] = defaultdict(list)
+DIET_INDEX: Dict[str, set] = defaultdict(set)
+for _i, _r in enumerate(RECIPES):
+    for _ing in _r["_ing_set"]:
+        INDEX[_ing].append(_i)
+    for _d in _r["_diet_set"]:
+        DIET_INDEX[_d].add(_i)
+
+# Integer ingredient IDs and per-recipe bitmasks (bit VOCAB[ing] set when the
+# recipe uses ing), so overlap scoring is a single AND + popcount per recipe
+VOCAB: Dict[str, int] = {ing: bit for bit, ing in enumerate(sorted(INDEX))}
+RECIPE_BITS: List[int] = [
+    sum(1 << VOCAB[ing] for ing in _r["_ing_set"]) for _r in RECIPES
+]
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
 # Build set of all known ingredients from recipe database
 def _get_valid_ingredients() -> set:
     """Extract all ingredients from recipe database for validation."""
@@ -49,6 +118,9 @@ def _get_valid_ingredients() -> set:
 
 VALID_INGREDIENTS = _get_valid_ingredients()
 
+# Treat semicolons as commas when splitting user input
+_SEP_TRANS = str.maketrans({";": ","})
+
 
 def parse_ingredients(text: str) -> List[str]:
     """Parse comma or semicolon-separated ingredient input into normalized list.
@@ -64,28 +136,29 @@ def parse_ingredients(text: str) -> List[str]:
     Returns:
         List of normalized ingredients
     """
-    import re
-
-    # Split on commas or semicolons first (preferred explicit separators)
-    parts = [p.strip() for p in re.split(r"[;,]", text) if p.strip()]
+    # Split on commas or semicolons first (preferred explicit separators),
+    # normalizing and dropping empty pieces in the same pass
+    parts = [p for p in (normalize(s) for s in text.translate(_SEP_TRANS).split(",")) if p]
 
     # If user didn't use commas/semicolons and provided a space-separated list
     # (e.g. `chicken rice broccoli`), split on whitespace as a fallback.
     if len(parts) == 1 and " " in text and "," not in text and ";" not in text:
-        parts = [p.strip() for p in text.split() if p.strip()]
+        parts = [p.lower() for p in text.split()]
 
-    normalized = [normalize(p) for p in parts]
-    return normalized
+    return parts
 
 
 def match_recipes(ingredients: List[str], min_match: int = 2, diet: str = None) -> List[Tuple[Dict[str, Any], int]]:
     """Find recipes matching user ingredients with optional dietary filtering.
     
     Algorithm:
-    1. Filter recipes by diet (if specified)
-    2. Count matching ingredients per recipe (intersection of ingredient sets)
-    3. Keep only recipes with >= min_match matching ingredients
-    4. Sort by match count (descending) then title (ascending)
+    1. Take candidates from DIET_INDEX when a diet is given
+    2. Resolve user ingredients to known recipe ingredients (exact or substring)
+    3. Otherwise gather candidate recipes from the inverted INDEX
+       (all recipes when min_match <= 0)
+    4. Score each candidate with a bitmask AND + popcount over ingredient IDs
+    5. Keep only recipes with >= min_match matches
+    6. Sort by match count (descending) then title (ascending)
     
     Args:
         ingredients: List of user ingredients
@@ -95,32 +168,37 @@ def match_recipes(ingredients: List[str], min_match: int = 2, diet: str = None)
     Returns:
         List of (recipe_dict, match_count) tuples, sorted by best matches
     """
+    # Apply dietary filter if specified: the diet's recipes are the only
+    # candidates, and an unknown diet short-circuits before any scoring
+    allowed = None
+    if diet:
+        allowed = DIET_INDEX.get(normalize(diet))
+        if not allowed:
+            return []
+
     # Normalize user-provided ingredients
     ing_set = set([normalize(i) for i in ingredients])
-    matches = []
-    
-    for r in RECIPES:
-        # Apply dietary filter if specified
-        if diet:
-            diets = [normalize(d) for d in r.get("diets", [])]
-            if normalize(diet) not in diets:
-                continue  # Skip recipes that don't match user's diet
-        
-        # Count ingredient overlap
-        recipe_ings_list = [normalize(i) for i in r.get("ingredients", [])]
 
-        # Allow substring and exact matches: e.g., user 'soba' matches 'soba noodles'
-        matched = set()
-        for u in ing_set:
-            for ri in recipe_ings_list:
-                if u == ri or u in ri or ri in u:
-                    matched.add(ri)
+    # Allow substring and exact matches: e.g., user 'soba' matches 'soba noodles'
+    terms = [ri for ri in VOCAB if any(u == ri or u in ri or ri in u for u in ing_set)]
+    user_bits = 0
+    for t in terms:
+        user_bits |= 1 << VOCAB[t]
+    if allowed is not None:
+        candidates = allowed
+    elif min_match <= 0:
+        # Zero-overlap recipes qualify too, so every recipe is a candidate
+        candidates = range(len(RECIPES))
+    else:
+        candidates = {idx for t in terms for idx in INDEX[t]}
+
+    matches = []
+    for idx in sorted(candidates):
+        count = _popcount(user_bits & RECIPE_BITS[idx])
 
-        count = len(matched)
-        
         # Keep recipe if it meets minimum threshold
         if count >= min_match:
-            matches.append((r, count))
+            matches.append((RECIPES[idx], count))
     
     # Sort: most matches first, then alphabetical
     matches.sort(key=lambda x: (-x[1], x[0]["title"]))
@@ -261,7 +339,7 @@ def find_recipe_by_title_or_index(query: str) -> Dict[str, Any]:
     
     # Try partial title match
     for r in RECIPES:
-        if q in normalize(r.get("title", "")):
+        if q in r["_title_lower"]:
             return r
     
     return {}
@@ -273,10 +351,7 @@ def get_available_diets() -> List[str]:
     Returns:
         Sorted list of unique diet tags (e.g., ["halal", "kosher", "vegan", ...])
     """
-    diets = set()
-    for r in RECIPES:
-        diets.update(r.get("diets", []))
-    return sorted(list(diets))
+    return list(AVAILABLE_DIETS)
 
 
 def validate_ingredients(ingredients: List[str]) -> Tuple[List[str], List[str]]:
@@ -1,5 +1,7 @@
 import unittest
 
+from src import recipe_helper
+
 
 def safe_default(ingredients):
     if len(ingredients) < 3:
@@ -26,5 +28,56 @@ class TestValidateIngredients(unittest.TestCase):
         self.assertEqual(result, ["apple", "milk", "bread"])
 
 
+def _scan_match_recipes(ingredients, min_match=2, diet=None):
+    # reference: the original linear scan over every recipe
+    norm = recipe_helper.normalize
+    ing_set = set(norm(i) for i in ingredients)
+    matches = []
+    for r in recipe_helper.RECIPES:
+        if diet and norm(diet) not in [norm(d) for d in r.get("diets", [])]:
+            continue
+        recipe_ings = [norm(i) for i in r.get("ingredients", [])]
+        matched = set()
+        for u in ing_set:
+            for ri in recipe_ings:
+                if u == ri or u in ri or ri in u:
+                    matched.add(ri)
+        if len(matched) >= min_match:
+            matches.append((r, len(matched)))
+    matches.sort(key=lambda x: (-x[1], x[0]["title"]))
+    return matches
+
+
+class TestMatchRecipes(unittest.TestCase):
+
+    def assertSameAsScan(self, ingredients, min_match=2, diet=None):
+        expected = _scan_match_recipes(ingredients, min_match, diet)
+        result = recipe_helper.match_recipes(ingredients, min_match, diet)
+        self.assertEqual([(id(r), c) for r, c in result], [(id(r), c) for r, c in expected])
+
+    def test_exact_and_substring_matches(self):
+        self.assertSameAsScan(["chicken", "rice", "broccoli"])
+        self.assertSameAsScan(["soba", "oil", "egg"])
+        self.assertSameAsScan(["chicken breast", "white rice"], min_match=1)
+
+    def test_diet_filter(self):
+        self.assertSameAsScan(["tofu", "soy sauce", "rice"], diet="vegan")
+        self.assertSameAsScan(["onion", "garlic", "oil"], diet=" Halal ")
+
+    def test_unknown_diet(self):
+        self.assertEqual(recipe_helper.match_recipes(["chicken", "rice"], diet="nope"), [])
+        self.assertSameAsScan(["chicken", "rice"], diet="nope")
+
+    def test_min_match_zero_includes_every_candidate(self):
+        self.assertSameAsScan(["chicken"], min_match=0)
+        self.assertSameAsScan(["chicken"], min_match=0, diet="vegetarian")
+        self.assertSameAsScan([], min_match=0)
+
+    def test_tie_ordering(self):
+        # ties on count sort by title, and equal titles keep database order
+        for ings in (["onion", "oil", "salt"], ["egg", "cheese", "tomato", "potato"]):
+            self.assertSameAsScan(ings, min_match=1)
+
+
 if __name__ == "__main__":
     unittest.main()